@@ -8,20 +8,32 @@ line coordinates.
 """
 
 import argparse
-import json
+import functools
+import glob
+import io
+import itertools
 import logging
+import multiprocessing
+import os
 import re
+import sqlite3
 import sys
+import threading
 import time
-from typing import List, Optional, Iterator, Dict, Any
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from collections import OrderedDict
+from typing import List, Optional, Iterable, Iterator, Dict, Any
+from logging.handlers import QueueHandler, QueueListener
 import xml.etree.ElementTree as ET
 
+import orjson
 import requests
 import urllib3
+from requests.adapters import HTTPAdapter
 from dotenv import load_dotenv
 from smart_open import open as smart_open  # type: ignore[import]
 
-from page_statistics import PageStatisticsProcessor
+from page_statistics import compute_page_statistics, log as page_statistics_log
 from impresso_cookbook import (  # type: ignore[import]
     get_s3_client,
     parse_s3_path,
@@ -35,8 +47,252 @@ load_dotenv()
 
 log = logging.getLogger(__name__)
 
-# Global cache for Gallica pagination XML to avoid repeated requests for the same issue
-_gallica_xml_cache: Dict[str, ET.Element] = {}
+# Shared HTTP session so that image servers are queried over pooled keep-alive
+# connections instead of a new TCP+TLS handshake per request
+_http = requests.Session()
+_http.mount("https://", HTTPAdapter(pool_connections=64, pool_maxsize=64))
+_http.mount("http://", HTTPAdapter(pool_connections=64, pool_maxsize=64))
+
+
+class LRUCache:
+    """
+    A thread-safe mapping that evicts its least recently used entries once it
+    holds more than `maxsize` items.
+    """
+
+    def __init__(self, maxsize: int) -> None:
+        self.maxsize = maxsize
+        self._data: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Any:
+        """Return the value cached for `key`, or None if it is not cached."""
+        with self._lock:
+            if key not in self._data:
+                return None
+            self._data.move_to_end(key)
+            return self._data[key]
+
+    def set(self, key: str, value: Any) -> None:
+        """Cache `value` for `key`, evicting the least recently used entry if full."""
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+
+class DimensionsCache:
+    """
+    A persistent SQLite cache of image dimensions keyed by IIIF base URI, so that
+    reruns over the same corpus do not query the image servers again.
+    """
+
+    def __init__(self, path: str) -> None:
+        """
+        Prepares the cache. The database is opened (and created if needed) on first
+        use in each process, so that no connection exists when workers are forked.
+
+        Args:
+            path (str): Path to the SQLite database file.
+        """
+        self.path = os.path.expanduser(path)
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        self._lock = threading.Lock()
+        self._db: Optional[sqlite3.Connection] = None
+        self._pid: Optional[int] = None
+
+    def _connect(self) -> sqlite3.Connection:
+        """
+        Returns the database connection of the current process, opening it on first
+        use, as SQLite connections must not be shared with forked worker processes.
+        """
+        if self._db is None or self._pid != os.getpid():
+            self._db = sqlite3.connect(self.path, timeout=30, check_same_thread=False)
+            self._pid = os.getpid()
+            self._db.execute("PRAGMA journal_mode=WAL")
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS dimensions"
+                " (uri TEXT PRIMARY KEY, width INTEGER, height INTEGER)"
+            )
+        return self._db
+
+    def get(self, uri: str) -> Optional[tuple[int, int]]:
+        """Return the cached (width, height) of `uri`, or None if unknown."""
+        with self._lock:
+            row = (
+                self._connect()
+                .execute("SELECT width, height FROM dimensions WHERE uri = ?", (uri,))
+                .fetchone()
+            )
+        return (row[0], row[1]) if row else None
+
+    def set(self, uri: str, width: int, height: int) -> None:
+        """Store the dimensions of `uri`."""
+        with self._lock:
+            db = self._connect()
+            db.execute(
+                "INSERT OR REPLACE INTO dimensions VALUES (?, ?, ?)",
+                (uri, width, height),
+            )
+            db.commit()
+
+
+# Gallica IIIF image URIs, capturing the ARK identifier and the page (e.g. 'f4')
+_GALLICA_IIIF_RE = re.compile(
+    r"https://gallica\.bnf\.fr/iiif/ark:/12148/([^/]+)/(f\d+)"
+)
+
+# Global cache of the page dimensions in Gallica pagination XML, to avoid repeated
+# requests for the same issue, bounded to keep memory in check with many issues
+_gallica_xml_cache = LRUCache(maxsize=1024)
+# Per-ARK locks serializing pagination XML downloads, so that the pages of an issue
+# whose image dimensions are fetched in parallel do not all download the same XML,
+# while the XML of different issues is still downloaded in parallel
+_gallica_xml_locks: Dict[str, threading.Lock] = {}
+_gallica_xml_locks_lock = threading.Lock()
+
+# Optional persistent cache for image dimensions, see enable_dimensions_cache()
+_dimensions_cache: Optional[DimensionsCache] = None
+
+# S3 transport parameters shared by all page file reads of a process
+_s3_transport_params: Optional[Dict[str, Any]] = None
+
+
+def enable_dimensions_cache(path: str) -> None:
+    """
+    Persist fetched image dimensions in the given SQLite file across runs.
+
+    Args:
+        path (str): Path to the SQLite database file.
+    """
+    global _dimensions_cache
+
+    _dimensions_cache = DimensionsCache(path)
+    log.info("Using persistent image dimensions cache %s", path)
+
+
+def get_pages_transport_params(file_path: str) -> Dict[str, Any]:
+    """
+    Returns the smart_open transport parameters to read a page file. The S3 client
+    is created on first use and reused for all files read by the process.
+
+    Args:
+        file_path (str): The S3 or local path of the page file.
+
+    Returns:
+        Dict[str, Any]: Transport parameters for smart_open.
+    """
+    global _s3_transport_params
+
+    if not file_path.startswith("s3://"):
+        return {}
+    if _s3_transport_params is None:
+        _s3_transport_params = get_transport_params(file_path)
+    return _s3_transport_params
+
+
+def dumps_json_line(obj: Any) -> bytes:
+    """
+    Serialize an object to a newline-terminated UTF-8 JSON line, including NumPy
+    scalars and arrays.
+
+    Args:
+        obj (Any): The object to serialize.
+
+    Returns:
+        bytes: The JSON line.
+    """
+    return orjson.dumps(
+        obj, option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_APPEND_NEWLINE
+    )
+
+
+def as_directory_prefix(prefix: str) -> str:
+    """
+    Normalize an S3 key prefix denoting a directory to end with a slash.
+
+    Listing a prefix without a trailing slash can be much slower on S3, as the
+    server cannot restrict the scan to a single directory. Prefixes that are empty
+    or whose last component looks like a file name are returned unchanged.
+
+    Args:
+        prefix (str): The S3 key prefix.
+
+    Returns:
+        str: The normalized prefix.
+    """
+    if not prefix or prefix.endswith("/") or "." in prefix.rsplit("/", 1)[-1]:
+        return prefix
+    return prefix + "/"
+
+
+def read_pages_file(
+    file_path: str, transport_params: Dict[str, Any]
+) -> List[Dict[str, Any]]:
+    """
+    Download, decompress and parse all pages of a single .jsonl.bz2 file.
+
+    Args:
+        file_path (str): The S3 or local path of the .jsonl.bz2 file.
+        transport_params (Dict[str, Any]): Transport parameters for smart_open.
+
+    Returns:
+        List[Dict[str, Any]]: The page JSON objects contained in the file.
+    """
+    with smart_open(file_path, "rb", transport_params=transport_params) as f:
+        # Read the decompressed stream in large chunks and parse the raw bytes
+        return [
+            orjson.loads(line) for line in io.BufferedReader(f, buffer_size=1 << 20)
+        ]
+
+
+def list_pages_files(s3_prefix: str, random: bool = False) -> List[str]:
+    """
+    List all page files (*pages.jsonl.bz2) located under the given S3 or local
+    prefix.
+
+    Args:
+        s3_prefix (str): The S3 or local prefix to search for .jsonl.bz2 files.
+        random (bool): If True, the order of the files returned is randomized.
+
+    Returns:
+        List[str]: The S3 or local paths of the page files.
+    """
+    if s3_prefix.startswith("s3://"):
+        s3_client = get_s3_client()
+        bucket, prefix = parse_s3_path(s3_prefix)
+
+        # List all files under the prefix; a single list_objects_v2 call stops at
+        # 1000 keys, so page through the full listing
+        paginator = s3_client.get_paginator("list_objects_v2")
+        file_paths = [
+            f"s3://{bucket}/{obj['Key']}"
+            for page in paginator.paginate(
+                Bucket=bucket,
+                Prefix=as_directory_prefix(prefix),
+                PaginationConfig={"PageSize": 1000},
+            )
+            for obj in page.get("Contents", [])
+            if obj["Key"].endswith("pages.jsonl.bz2")
+        ]
+    else:
+        # Search local directories recursively, like an S3 prefix listing
+        pattern = (
+            os.path.join(s3_prefix, "**") if os.path.isdir(s3_prefix) else s3_prefix
+        )
+        file_paths = sorted(
+            path
+            for path in glob.glob(pattern, recursive=True)
+            if path.endswith("pages.jsonl.bz2")
+        )
+
+    if random:
+        import random as rnd
+
+        rnd.shuffle(file_paths)
+
+    return file_paths
 
 
 def fetch_all_pages(s3_prefix: str, random: bool = False) -> Iterator[Dict[str, Any]]:
@@ -53,29 +309,29 @@ def fetch_all_pages(s3_prefix: str, random: bool = False) -> Iterator[Dict[str,
     transport_params = (
         {"client": get_s3_client()} if s3_prefix.startswith("s3://") else {}
     )
-    s3_client = get_s3_client()
-    bucket, prefix = parse_s3_path(s3_prefix)
+    for file_path in list_pages_files(s3_prefix, random):
+        yield from read_pages_file(file_path, transport_params)
 
-    # List all files under the prefix
-    response = s3_client.list_objects_v2(Bucket=bucket, Prefix=prefix)
-    objects = [
-        obj["Key"]
-        for obj in response.get("Contents", [])
-        if obj["Key"].endswith("pages.jsonl.bz2")
-    ]
 
-    if random:
-        import random as rnd
+def index_gallica_pagination(root: ET.Element) -> Dict[str, tuple[int, int]]:
+    """
+    Index the image dimensions of all pages of a Gallica pagination XML document.
 
-        rnd.shuffle(objects)
+    Args:
+        root (ET.Element): The root of the pagination XML document.
 
-    for obj_key in objects:
-        file_path = f"s3://{bucket}/{obj_key}"
-        with smart_open(
-            file_path, "rb", encoding="utf-8", transport_params=transport_params
-        ) as f:
-            for line in f:
-                yield json.loads(line)
+    Returns:
+        Dict[str, tuple[int, int]]: The width and height of each page image, keyed
+        by the page order number (e.g. '4').
+    """
+    page_dimensions: Dict[str, tuple[int, int]] = {}
+    for page in root.iter("page"):
+        ordre = page.findtext("ordre")
+        width = page.findtext("image_width")
+        height = page.findtext("image_height")
+        if ordre is not None and width and height:
+            page_dimensions.setdefault(ordre, (int(width), int(height)))
+    return page_dimensions
 
 
 def fetch_image_dimensions_from_gallica_xml(
@@ -91,48 +347,46 @@ def fetch_image_dimensions_from_gallica_xml(
     Returns:
         tuple[int | None, int | None]: A tuple containing the width and height
     """
-    global _gallica_xml_cache
-
     try:
         # Extract numeric page number from format like 'f4'
-        if page_number.startswith("f"):
-            page_num = page_number[1:]
-        else:
-            page_num = page_number
+        page_num = page_number[1:] if page_number[:1] == "f" else page_number
 
-        # Check if we already have the XML cached for this ARK ID
-        if ark_id in _gallica_xml_cache:
-            root = _gallica_xml_cache[ark_id]
+        # Check if we already have the page dimensions cached for this ARK ID
+        page_dimensions = _gallica_xml_cache.get(ark_id)
+        if page_dimensions is not None:
             log.debug(f"Using cached pagination XML for ARK {ark_id}")
         else:
-            # Fetch and cache the XML
-            pagination_url = f"https://gallica.bnf.fr/services/Pagination?ark={ark_id}"
-            log.info(f"Fetching pagination XML from {pagination_url}")
-            response = requests.get(pagination_url, verify=False, timeout=10)
-            response.raise_for_status()
-
-            # Parse XML and cache it
-            root = ET.fromstring(response.content)
-            _gallica_xml_cache[ark_id] = root
-            log.info(f"Cached pagination XML for ARK {ark_id}")
-
-        # Find the page with the matching order number
-        for page in root.findall(".//page"):
-            ordre = page.find("ordre")
-            if ordre is not None and ordre.text == page_num:
-                width_elem = page.find("image_width")
-                height_elem = page.find("image_height")
+            with _gallica_xml_locks_lock:
+                ark_lock = _gallica_xml_locks.setdefault(ark_id, threading.Lock())
+            try:
+                with ark_lock:
+                    # Another thread may have cached it while we were waiting
+                    page_dimensions = _gallica_xml_cache.get(ark_id)
+                    if page_dimensions is None:
+                        # Fetch the XML and cache the dimensions of all its pages
+                        pagination_url = (
+                            f"https://gallica.bnf.fr/services/Pagination?ark={ark_id}"
+                        )
+                        log.info(f"Fetching pagination XML from {pagination_url}")
+                        response = _http.get(pagination_url, verify=False, timeout=10)
+                        response.raise_for_status()
 
-                if (
-                    width_elem is not None
-                    and height_elem is not None
-                    and width_elem.text
-                    and height_elem.text
-                ):
-                    width = int(width_elem.text)
-                    height = int(height_elem.text)
-                    log.debug(f"Found dimensions for page {page_num}: {width}x{height}")
-                    return width, height
+                        page_dimensions = index_gallica_pagination(
+                            ET.fromstring(response.content)
+                        )
+                        _gallica_xml_cache.set(ark_id, page_dimensions)
+                        log.info(f"Cached pagination XML for ARK {ark_id}")
+            finally:
+                # Later requests for this ARK are served by the cache
+                with _gallica_xml_locks_lock:
+                    if _gallica_xml_locks.get(ark_id) is ark_lock:
+                        del _gallica_xml_locks[ark_id]
+
+        # Look up the page with the matching order number
+        if page_num in page_dimensions:
+            width, height = page_dimensions[page_num]
+            log.debug(f"Found dimensions for page {page_num}: {width}x{height}")
+            return width, height
 
         log.warning(f"Page {page_num} not found in pagination XML for {ark_id}")
         return None, None
@@ -150,6 +404,9 @@ def fetch_image_dimensions(iiif_base_uri: str) -> tuple[int | None, int | None]:
     Fetch the dimensions (width and height) of an image from its IIIF base URI.
     For Gallica URIs, uses the pagination XML service for efficiency.
 
+    Results, including failures, are memoized in-process and successful results
+    also in a persistent cache if enabled with enable_dimensions_cache().
+
     Args:
         iiif_base_uri (str): The IIIF base URI of the image.
 
@@ -158,11 +415,60 @@ def fetch_image_dimensions(iiif_base_uri: str) -> tuple[int | None, int | None]:
         image in pixels.
 
     Raises:
-        Exception: If the dimensions cannot be fetched after multiple attempts.
+        RuntimeError: If the dimensions cannot be fetched after multiple attempts.
+    """
+    width, height, error = _cached_image_dimensions(iiif_base_uri)
+    if error is not None:
+        raise RuntimeError(error)
+    return width, height
+
+
+@functools.lru_cache(maxsize=200_000)
+def _cached_image_dimensions(
+    iiif_base_uri: str,
+) -> tuple[int | None, int | None, Optional[str]]:
+    """
+    Look up the dimensions of an image in the persistent cache or fetch them.
+    Failures are returned as their error message rather than raised, so that they
+    are memoized as well and broken URIs are not retried within a run, without
+    keeping the exception and the frames of its traceback alive.
+
+    Args:
+        iiif_base_uri (str): The IIIF base URI of the image.
+
+    Returns:
+        tuple[int | None, int | None, Optional[str]]: The width and height of the
+        image in pixels, and the error message if they could not be fetched.
+    """
+    if _dimensions_cache is not None:
+        cached = _dimensions_cache.get(iiif_base_uri)
+        if cached is not None:
+            log.debug("Using cached image dimensions for %s", iiif_base_uri)
+            return cached[0], cached[1], None
+
+    try:
+        width, height = _fetch_image_dimensions(iiif_base_uri)
+    except Exception as e:
+        return None, None, str(e)
+    if _dimensions_cache is not None and width is not None and height is not None:
+        _dimensions_cache.set(iiif_base_uri, width, height)
+    return width, height, None
+
+
+def _fetch_image_dimensions(iiif_base_uri: str) -> tuple[int | None, int | None]:
+    """
+    Fetch the dimensions of an image from the Gallica pagination XML service or
+    the IIIF info.json of its base URI, without any caching.
+
+    Args:
+        iiif_base_uri (str): The IIIF base URI of the image.
+
+    Returns:
+        tuple[int | None, int | None]: A tuple containing the width and height of the
+        image in pixels.
     """
     # Check if this is a Gallica IIIF URI and extract ARK ID and page
-    gallica_pattern = r"https://gallica\.bnf\.fr/iiif/ark:/12148/([^/]+)/(f\d+)"
-    gallica_match = re.match(gallica_pattern, iiif_base_uri)
+    gallica_match = _GALLICA_IIIF_RE.match(iiif_base_uri)
 
     if gallica_match:
         ark_id = gallica_match.group(1)
@@ -181,9 +487,7 @@ def fetch_image_dimensions(iiif_base_uri: str) -> tuple[int | None, int | None]:
             log.debug(
                 "Loading IIIF manifest from %s (attempt %d)", iiif_manifest, attempt + 1
             )
-            response = requests.get(
-                url=iiif_manifest, verify=False, timeout=1 + attempt
-            )
+            response = _http.get(url=iiif_manifest, verify=False, timeout=1 + attempt)
             response.raise_for_status()
             info = response.json()
             log.debug(
@@ -194,16 +498,66 @@ def fetch_image_dimensions(iiif_base_uri: str) -> tuple[int | None, int | None]:
         except Exception as e:
             log.error(f"Attempt {attempt + 1} failed for {iiif_manifest}: {e}")
 
-            time.sleep(1 + attempt)
             if attempt == attempts:  # On the last attempt, log and exit
                 log.error(
                     f"Failed to fetch image dimensions from {iiif_manifest} after 3"
                     " attempts."
                 )
                 raise e
+            time.sleep(1 + attempt)
     return None, None
 
 
+def batched(iterable: Iterable[Any], size: int) -> Iterator[List[Any]]:
+    """
+    Split an iterable into consecutive lists of at most `size` items.
+
+    Args:
+        iterable (Iterable[Any]): The items to split.
+        size (int): The maximum number of items per batch.
+
+    Returns:
+        iter: A generator that yields the batches.
+    """
+    iterator = iter(iterable)
+    while batch := list(itertools.islice(iterator, size)):
+        yield batch
+
+
+def _out_of_bounds_entry(
+    seq_key: str,
+    seq: int,
+    coord: List[int],
+    pOf: Optional[str],
+    image_width: int,
+    image_height: int,
+) -> Dict[str, Any]:
+    """
+    Build the report entry of an element lying outside the page image.
+
+    Args:
+        seq_key (str): The name of the sequence number field (e.g. 'line_seq').
+        seq (int): The sequence number of the element within its parent.
+        coord (List[int]): The x, y, width and height of the element.
+        pOf (Optional[str]): The content item the element belongs to.
+        image_width (int): The width of the page image in pixels.
+        image_height (int): The height of the page image in pixels.
+
+    Returns:
+        Dict[str, Any]: The out-of-bounds entry, including the excess on each side.
+    """
+    x, y, width, height = coord
+    return {
+        seq_key: seq,
+        "coord": coord,
+        "pOf": pOf,
+        "excess_width": max(0, x + width - image_width),
+        "excess_height": max(0, y + height - image_height),
+        "excess_x": max(0, -x),
+        "excess_y": max(0, -y),
+    }
+
+
 def check_lines_within_boundaries(
     page_json: dict, image_width: int, image_height: int
 ) -> dict:
@@ -228,75 +582,86 @@ def check_lines_within_boundaries(
     current_pOf = None
     page_id = page_json.get("id", "unknown")
 
+    # Scalar checks inline with the traversal, looking up each coordinate list only
+    # once; this is faster than gathering the coordinates into a NumPy array first
     for region_seq, region in enumerate(page_json.get("r", [])):
-        if "pOf" in region:
-            current_pOf = region["pOf"]
+        current_pOf = region.get("pOf", current_pOf)
 
         # Check region boundaries
-        if "c" in region and len(region["c"]) >= 4:
-            x, y, width, height = region["c"]
+        c = region.get("c")
+        if c and len(c) >= 4:
+            x, y, width, height = c
             if x < 0 or y < 0 or x + width > image_width or y + height > image_height:
-                log.error(f"Page {page_id}: Region out of bounds: {region['c']}")
+                log.debug("Page %s: Region out of bounds: %s", page_id, c)
                 out_of_bounds_regions.append(
-                    {
-                        "region_seq": region_seq,
-                        "coord": region["c"],
-                        "pOf": current_pOf,
-                        "excess_width": max(0, x + width - image_width),
-                        "excess_height": max(0, y + height - image_height),
-                        "excess_x": max(0, -x),
-                        "excess_y": max(0, -y),
-                    }
+                    _out_of_bounds_entry(
+                        "region_seq",
+                        region_seq,
+                        c,
+                        current_pOf,
+                        image_width,
+                        image_height,
+                    )
                 )
 
         for paragraph_seq, paragraph in enumerate(region.get("p", [])):
             # Check paragraph boundaries
-            if "c" in paragraph and len(paragraph["c"]) >= 4:
-                x, y, width, height = paragraph["c"]
+            c = paragraph.get("c")
+            if c and len(c) >= 4:
+                x, y, width, height = c
                 if (
                     x < 0
                     or y < 0
                     or x + width > image_width
                     or y + height > image_height
                 ):
-                    log.error(
-                        f"Page {page_id}: Paragraph out of bounds: {paragraph['c']}"
-                    )
+                    log.debug("Page %s: Paragraph out of bounds: %s", page_id, c)
                     out_of_bounds_paragraphs.append(
-                        {
-                            "paragraph_seq": paragraph_seq,
-                            "coord": paragraph["c"],
-                            "pOf": current_pOf,
-                            "excess_width": max(0, x + width - image_width),
-                            "excess_height": max(0, y + height - image_height),
-                            "excess_x": max(0, -x),
-                            "excess_y": max(0, -y),
-                        }
+                        _out_of_bounds_entry(
+                            "paragraph_seq",
+                            paragraph_seq,
+                            c,
+                            current_pOf,
+                            image_width,
+                            image_height,
+                        )
                     )
 
-            for line_seq, line in enumerate(paragraph.get("l", [])):
-                total_lines += 1
-                if "c" in line and len(line["c"]) >= 4:
-                    x, y, width, height = line["c"]
+            lines = paragraph.get("l", [])
+            total_lines += len(lines)
+            for line_seq, line in enumerate(lines):
+                c = line.get("c")
+                if c and len(c) >= 4:
+                    x, y, width, height = c
                     if (
                         x < 0
                         or y < 0
                         or x + width > image_width
                         or y + height > image_height
                     ):
-                        log.error(f"Page {page_id}: Line out of bounds: {line['c']}")
+                        log.debug("Page %s: Line out of bounds: %s", page_id, c)
                         out_of_bounds_lines.append(
-                            {
-                                "line_seq": line_seq,
-                                "coord": line["c"],
-                                "pOf": current_pOf,
-                                "excess_width": max(0, x + width - image_width),
-                                "excess_height": max(0, y + height - image_height),
-                                "excess_x": max(0, -x),
-                                "excess_y": max(0, -y),
-                            }
+                            _out_of_bounds_entry(
+                                "line_seq",
+                                line_seq,
+                                c,
+                                current_pOf,
+                                image_width,
+                                image_height,
+                            )
                         )
 
+    # One message per page rather than per element, as the details are reported in
+    # the output anyway
+    if out_of_bounds_regions or out_of_bounds_paragraphs or out_of_bounds_lines:
+        log.error(
+            "Page %s: %d regions, %d paragraphs and %d lines out of bounds",
+            page_id,
+            len(out_of_bounds_regions),
+            len(out_of_bounds_paragraphs),
+            len(out_of_bounds_lines),
+        )
+
     return {
         "total_lines": total_lines,
         "out_of_bounds_lines": out_of_bounds_lines,
@@ -305,6 +670,28 @@ def check_lines_within_boundaries(
     }
 
 
+def _positive_int(value: str) -> int:
+    """
+    Parses a command-line value as an integer of at least 1.
+
+    Args:
+        value (str): The command-line value.
+
+    Returns:
+        int: The parsed integer.
+
+    Raises:
+        argparse.ArgumentTypeError: If the value is not a positive integer.
+    """
+    try:
+        number = int(value)
+    except ValueError:
+        number = 0
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"{value!r} is not a positive integer")
+    return number
+
+
 def parse_arguments(args: Optional[List[str]] = None) -> argparse.Namespace:
     """
     Parse command-line arguments.
@@ -321,7 +708,11 @@ def parse_arguments(args: Optional[List[str]] = None) -> argparse.Namespace:
             " boundaries."
         )
     )
-    parser.add_argument("s3_path", type=str, help="S3 path to the .jsonl.bz2 file.")
+    parser.add_argument(
+        "s3_path",
+        type=str,
+        help="S3 or local prefix (directory or file) of the .jsonl.bz2 page files.",
+    )
     parser.add_argument(
         "--output",
         type=str,
@@ -355,9 +746,73 @@ def parse_arguments(args: Optional[List[str]] = None) -> argparse.Namespace:
             " (https://openapi.bnf.fr/iiif/presentation/v3)."
         ),
     )
+    parser.add_argument(
+        "--dimensions-cache",
+        dest="dimensions_cache",
+        required=False,
+        metavar="FILE",
+        help=(
+            "SQLite file in which to persist fetched image dimensions across runs"
+            " (e.g. ~/.cache/bboxqa/dimensions.sqlite)."
+        ),
+    )
+    parser.add_argument(
+        "--process-concurrency",
+        dest="process_concurrency",
+        type=_positive_int,
+        default=None,
+        help=(
+            "Number of worker processes, each downloading and checking one page file"
+            " at a time (default: number of CPUs, at most --dim-concurrency)."
+        ),
+    )
+    parser.add_argument(
+        "--dim-concurrency",
+        dest="dim_concurrency",
+        type=_positive_int,
+        default=32,
+        help=(
+            "Maximum number of parallel image dimension requests, shared among the"
+            " worker processes, each of which makes at least one at a time"
+            " (default: %(default)s)."
+        ),
+    )
     return parser.parse_args(args)
 
 
+class _ForwardingHandler(logging.Handler):
+    """
+    Hands log records received from worker processes to the logger of the same
+    name in the main process, and so to the handlers configured there.
+    """
+
+    def emit(self, record: logging.LogRecord) -> None:
+        logging.getLogger(record.name).handle(record)
+
+
+def _init_worker(
+    log_queue: multiprocessing.Queue, log_level: str, dimensions_cache: Optional[str]
+) -> None:
+    """
+    Configures logging and the persistent image dimensions cache in a worker
+    process, which does not inherit them under the spawn or forkserver start
+    methods. Log records are sent to the main process instead of being written by
+    each worker, which would otherwise open the log file again.
+
+    Args:
+        log_queue (multiprocessing.Queue): Queue read by the main process.
+        log_level (str): Logging level.
+        dimensions_cache (Optional[str]): Path to a persistent image dimensions
+            cache.
+    """
+    for logger in (log, page_statistics_log):
+        logger.handlers = [QueueHandler(log_queue)]
+        logger.setLevel(log_level)
+        logger.propagate = False
+    if dimensions_cache:
+        enable_dimensions_cache(dimensions_cache)
+
+
 class BoundaryCheckProcessor:
     """
     A processor class that checks if text lines are within page image boundaries.
@@ -371,6 +826,9 @@ class BoundaryCheckProcessor:
         iiif_gallica_v3: bool = False,
         log_level: str = "INFO",
         log_file: Optional[str] = None,
+        dimensions_cache: Optional[str] = None,
+        process_concurrency: Optional[int] = None,
+        dim_concurrency: int = 32,
     ) -> None:
         """
         Initializes the BoundaryCheckProcessor with explicit parameters.
@@ -382,6 +840,13 @@ class BoundaryCheckProcessor:
             iiif_gallica_v3 (bool): Whether to patch Gallica IIIF links
             log_level (str): Logging level (default: "INFO")
             log_file (Optional[str]): Path to log file (default: None)
+            dimensions_cache (Optional[str]): Path to a persistent image dimensions
+                cache (default: None)
+            process_concurrency (Optional[int]): Number of worker processes
+                (default: number of CPUs, at most dim_concurrency)
+            dim_concurrency (int): Maximum number of parallel image dimension
+                requests over all worker processes, at least one per process
+                (default: 32)
         """
         self.s3_path = s3_path
         self.output = output
@@ -389,21 +854,45 @@ class BoundaryCheckProcessor:
         self.iiif_gallica_v3 = iiif_gallica_v3
         self.log_level = log_level
         self.log_file = log_file
+        self.dimensions_cache = dimensions_cache
+        self.process_concurrency = (
+            process_concurrency
+            if process_concurrency is not None
+            else min(os.cpu_count() or 1, dim_concurrency)
+        )
+        self.dim_concurrency = dim_concurrency
 
-        # Configure the module-specific logger
+        # Configure the module-specific loggers
         setup_logging(self.log_level, self.log_file, logger=log)
+        setup_logging(self.log_level, self.log_file, logger=page_statistics_log)
+
+        if self.dim_concurrency < self.process_concurrency:
+            log.warning(
+                "Dimension concurrency %d is lower than the number of worker"
+                " processes, up to %d image dimension requests will run in parallel",
+                self.dim_concurrency,
+                self.process_concurrency,
+            )
+
+        if self.dimensions_cache:
+            enable_dimensions_cache(self.dimensions_cache)
 
         # Initialize S3 client and timestamp
         self.s3_client = get_s3_client()
         self.timestamp = get_timestamp()
 
-        # Initialize page statistics processor for computing page stats
-        self.page_stats_processor = PageStatisticsProcessor(
-            input_file="dummy",  # Not used in this context
-            output_file="dummy",  # Not used in this context
-            log_level=self.log_level,
-            log_file=self.log_file,
-        )
+        # Pending image dimension requests of the current batch, by IIIF base URI
+        self._dimension_futures: Dict[str, Future] = {}
+
+    def __getstate__(self) -> Dict[str, Any]:
+        """
+        Returns the state sent to worker processes, without the S3 client, which
+        cannot be pickled and is not needed there.
+        """
+        state = self.__dict__.copy()
+        state["s3_client"] = None
+        state["_dimension_futures"] = {}
+        return state
 
     def run(self) -> None:
         """
@@ -420,19 +909,39 @@ class BoundaryCheckProcessor:
 
             summary = []
 
-            for page_json in fetch_all_pages(self.s3_path):
-                result = self.process_page(page_json)
-                if result:
-                    summary.append(result)
-
-                    # Update yearly totals
-                    year_total_lines += result["total_lines"]
-                    year_out_of_bounds_lines += len(result["out_of_bounds_lines"])
-                    year_out_of_bounds_paragraphs += len(
-                        result["out_of_bounds_paragraphs"]
-                    )
-                    year_out_of_bounds_regions += len(result["out_of_bounds_regions"])
-                    year_total_pages += 1
+            # Worker log records are written by the handlers of this process
+            log_queue: multiprocessing.Queue = multiprocessing.Queue()
+            log_listener = QueueListener(log_queue, _ForwardingHandler())
+            log_listener.start()
+
+            # Page files are processed end-to-end by worker processes, so that only
+            # the small result entries, not the page JSON, cross process boundaries
+            try:
+                with ProcessPoolExecutor(
+                    max_workers=self.process_concurrency,
+                    initializer=_init_worker,
+                    initargs=(log_queue, self.log_level, self.dimensions_cache),
+                ) as executor:
+                    for results in executor.map(
+                        self.process_pages_file, list_pages_files(self.s3_path)
+                    ):
+                        for result in results:
+                            summary.append(result)
+
+                            # Update yearly totals
+                            year_total_lines += result["total_lines"]
+                            year_out_of_bounds_lines += len(
+                                result["out_of_bounds_lines"]
+                            )
+                            year_out_of_bounds_paragraphs += len(
+                                result["out_of_bounds_paragraphs"]
+                            )
+                            year_out_of_bounds_regions += len(
+                                result["out_of_bounds_regions"]
+                            )
+                            year_total_pages += 1
+            finally:
+                log_listener.stop()
 
             year_total_out_of_bounds = (
                 year_out_of_bounds_lines
@@ -444,15 +953,20 @@ class BoundaryCheckProcessor:
             if self.output:
                 with smart_open(
                     self.output,
-                    "w",
-                    encoding="utf-8",
+                    "wb",
                     transport_params=get_transport_params(self.output),
                 ) as output_file:
+                    # Write the serialized lines in chunks of about 1 MiB
+                    buffer = bytearray()
                     for entry in summary:
-                        output_file.write(json.dumps(entry, ensure_ascii=False) + "\n")
+                        buffer += dumps_json_line(entry)
+                        if len(buffer) >= 1 << 20:
+                            output_file.write(buffer)
+                            buffer.clear()
+                    output_file.write(buffer)
             else:
                 for entry in summary:
-                    print(json.dumps(entry, ensure_ascii=False))
+                    sys.stdout.write(dumps_json_line(entry).decode("utf-8"))
 
             log.info(
                 "Yearly summary: %d lines, %d out-of-bounds lines, %d out-of-bounds"
@@ -469,15 +983,57 @@ class BoundaryCheckProcessor:
             log.error(f"Error processing file: {e}", exc_info=True)
             sys.exit(1)
 
-    def process_page(self, page_json: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    def process_pages_file(self, file_path: str) -> List[Dict[str, Any]]:
         """
-        Processes a single page JSON object.
+        Processes all pages of a single page file. Runs in a worker process.
+
+        Args:
+            file_path (str): The S3 or local path of the .jsonl.bz2 page file.
+
+        Returns:
+            List[Dict[str, Any]]: The results of the successfully processed pages.
+        """
+        results = []
+        pages = read_pages_file(file_path, get_pages_transport_params(file_path))
+        dim_threads = max(1, self.dim_concurrency // self.process_concurrency)
+        with ThreadPoolExecutor(max_workers=dim_threads) as executor:
+            for batch in batched(pages, 64):
+                self.prefetch_image_dimensions(batch, executor)
+                for page_json in batch:
+                    result = self.process_page(page_json)
+                    if result:
+                        results.append(result)
+                self._dimension_futures.clear()
+        return results
+
+    def prefetch_image_dimensions(
+        self, pages: List[Dict[str, Any]], executor: ThreadPoolExecutor
+    ) -> None:
+        """
+        Starts fetching the image dimensions of a batch of pages in parallel, so that
+        process_page() does not wait on one image server request at a time.
+
+        Args:
+            pages (List[Dict[str, Any]]): The page JSON data of the batch.
+            executor (ThreadPoolExecutor): The executor running the requests.
+        """
+        for page_json in pages:
+            iiif_base_uri = self.get_iiif_base_uri(page_json)
+            if iiif_base_uri and iiif_base_uri not in self._dimension_futures:
+                self._dimension_futures[iiif_base_uri] = executor.submit(
+                    fetch_image_dimensions, iiif_base_uri
+                )
+
+    def get_iiif_base_uri(self, page_json: Dict[str, Any]) -> Optional[str]:
+        """
+        Returns the IIIF base URI of a page, patching Gallica links to the new server
+        if requested.
 
         Args:
             page_json (Dict[str, Any]): The page JSON data.
 
         Returns:
-            Optional[Dict[str, Any]]: The processed result or None if processing failed.
+            Optional[str]: The IIIF base URI or None if the page has none.
         """
         if self.iiif_gallica_v3:
             if "iiif_img_base_uri" in page_json and page_json[
@@ -493,8 +1049,20 @@ class BoundaryCheckProcessor:
                     page_json["iiif_img_base_uri"],
                 )
 
+        return page_json.get("iiif_img_base_uri", page_json.get("iiif"))
+
+    def process_page(self, page_json: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """
+        Processes a single page JSON object.
+
+        Args:
+            page_json (Dict[str, Any]): The page JSON data.
+
+        Returns:
+            Optional[Dict[str, Any]]: The processed result or None if processing failed.
+        """
         page_id = page_json["id"]
-        iiif_base_uri = page_json.get("iiif_img_base_uri", page_json.get("iiif"))
+        iiif_base_uri = self.get_iiif_base_uri(page_json)
         manifest_info: Dict[str, Any] = {
             "iiif_manifest": {"iiif_base_uri": iiif_base_uri}
         }
@@ -504,7 +1072,10 @@ class BoundaryCheckProcessor:
             return None
 
         try:
-            image_width, image_height = fetch_image_dimensions(iiif_base_uri)
+            future = self._dimension_futures.get(iiif_base_uri)
+            image_width, image_height = (
+                future.result() if future else fetch_image_dimensions(iiif_base_uri)
+            )
             log.info("Retrieved IIIF for %s from %s", page_id, iiif_base_uri)
         except Exception as e:
             log.error(f"Failed to fetch image dimensions for {page_id}: {e}")
@@ -520,7 +1091,7 @@ class BoundaryCheckProcessor:
             page_json, image_width, image_height
         )
 
-        page_stats = self.page_stats_processor.compute_statistics(page_json)
+        page_stats = compute_page_statistics(page_json)
 
         entry = {
             "page_id": page_id,
@@ -557,6 +1128,9 @@ def main(args: Optional[List[str]] = None) -> None:
         iiif_gallica_v3=options.iiif_gallica_v3,
         log_level=options.log_level,
         log_file=options.log_file,
+        dimensions_cache=options.dimensions_cache,
+        process_concurrency=options.process_concurrency,
+        dim_concurrency=options.dim_concurrency,
     )
 
     # Log the parsed options after logger is configured
@@ -21,7 +21,6 @@ Example:
 
 import logging
 import argparse
-import json
 import sys
 from smart_open import open as smart_open  # type: ignore
 from typing import List, Optional, Dict, Any
@@ -33,6 +32,7 @@ from impresso_cookbook import (  # type: ignore
     get_transport_params,
 )
 import numpy as np
+import orjson
 
 log = logging.getLogger(__name__)
 
@@ -119,22 +119,25 @@ class PageStatisticsProcessor:
         try:
             with smart_open(
                 self.input_file,
-                "r",
-                encoding="utf-8",
+                "rb",
                 transport_params=get_transport_params(self.input_file),
             ) as f:
-                json_data = json.load(f)
+                json_data = orjson.loads(f.read())
 
-            stats = self.compute_statistics(json_data)
+            stats = compute_page_statistics(json_data)
             stats["timestamp"] = self.timestamp
 
             with smart_open(
                 self.output_file,
-                "w",
-                encoding="utf-8",
+                "wb",
                 transport_params=get_transport_params(self.output_file),
             ) as output_stream:
-                output_stream.write(json.dumps(stats, ensure_ascii=False) + "\n")
+                output_stream.write(
+                    orjson.dumps(
+                        stats,
+                        option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_APPEND_NEWLINE,
+                    )
+                )
 
         except Exception as e:
             log.error("Error processing file: %s", e, exc_info=True)
@@ -150,182 +153,169 @@ class PageStatisticsProcessor:
         Returns:
             Dict[str, Any]: A dictionary containing computed statistics.
         """
-        page_id = json_data.get("id", "unknown")
-
-        # Detect reversed adjacent lines in paragraphs
-        para_counter = 0
-        for region in json_data["r"]:
-            for para in region["p"]:
-                para_counter += 1
-                filtered_lines = [
-                    line for line in para["l"] if "c" in line and len(line["c"]) >= 4
-                ]
-                for idx in range(1, len(filtered_lines)):
-                    prev_c = filtered_lines[idx - 1]["c"]
-                    curr_c = filtered_lines[idx]["c"]
-                    if curr_c[1] + curr_c[3] < prev_c[1]:
+        return compute_page_statistics(json_data)
+
+
+def compute_page_statistics(json_data: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Compute statistics from the given page JSON data. Does not depend on any
+    processor state, so that it can be called directly by other tools.
+
+    All statistics are gathered in a single traversal of the regions, paragraphs
+    and lines of the page.
+
+    Args:
+        json_data (Dict[str, Any]): The JSON data containing document structure.
+
+    Returns:
+        Dict[str, Any]: A dictionary containing computed statistics.
+    """
+    page_id = json_data.get("id", "unknown")
+    debug_enabled = log.isEnabledFor(logging.DEBUG)
+
+    num_regions = len(json_data["r"])
+    num_paragraphs = 0
+    num_lines = 0
+    num_empty_lines = 0
+    line_widths = []
+    line_heights = []
+    max_area = 0
+    largest_coords = {}
+    paragraph_coverages = []
+
+    para_counter = 0
+    for region in json_data["r"]:
+        num_paragraphs += len(region["p"])
+        for para in region["p"]:
+            para_counter += 1
+            num_lines += len(para["l"])
+
+            # Bounding box and total area of the lines with complete coordinates
+            num_coords = 0
+            min_x = min_y = max_x = max_y = total_line_area = prev_top = 0
+            for line in para["l"]:
+                t = line.get("t")
+                c = line.get("c")
+
+                # A line is empty unless one of its segments has non-blank text
+                for segment in t or ():
+                    tx = segment.get("tx")
+                    if tx and not tx.isspace():
+                        break
+                else:
+                    num_empty_lines += 1
+
+                if not c:
+                    continue
+                line_widths.append(c[2])
+                if len(c) < 4:
+                    continue
+                if t:
+                    line_heights.append(c[3])
+
+                x, y, w, h = c[:4]
+                if num_coords == 0:
+                    min_x, min_y, max_x, max_y = x, y, x + w, y + h
+                else:
+                    # Detect reversed adjacent lines in paragraphs
+                    if y + h < prev_top:
                         log.info(
                             "Page %s: Paragraph %d has reversed line order between"
                             " lines %d and %d: prev top y=%s, next bottom y=%s",
                             page_id,
                             para_counter,
-                            idx - 1,
-                            idx,
-                            prev_c[1],
-                            curr_c[1] + curr_c[3],
+                            num_coords - 1,
+                            num_coords,
+                            prev_top,
+                            y + h,
                         )
-
-        for region in json_data["r"]:
-            for para in region["p"]:
+                    if x < min_x:
+                        min_x = x
+                    if y < min_y:
+                        min_y = y
+                    if x + w > max_x:
+                        max_x = x + w
+                    if y + h > max_y:
+                        max_y = y + h
+                total_line_area += w * h
+                num_coords += 1
+                prev_top = y
+
+            if num_coords == 0:
+                continue
+
+            # Track the largest paragraph
+            area = (max_x - min_x) * (max_y - min_y)
+            if area > max_area:
+                max_area = area
+                largest_coords = {
+                    "x": min_x,
+                    "y": min_y,
+                    "width": max_x - min_x,
+                    "height": max_y - min_y,
+                }
+
+            # Compute paragraph coverage percentage
+            coverage = round(total_line_area / area * 100, 2) if area > 0 else 0
+            if coverage < 70:
+                log.info(
+                    "Page %s: Paragraph %d coverage below 70%%: %s%% at x=%s,"
+                    " y=%s, width=%s, height=%s: %s",
+                    page_id,
+                    para_counter,
+                    coverage,
+                    min_x,
+                    min_y,
+                    max_x - min_x,
+                    max_y - min_y,
+                    extract_line_text(para["l"][0])[:20],
+                )
+            if coverage < 70 and debug_enabled:
+                log.debug(
+                    "Page %s: Paragraph %d coverage below 70%%, emitting line"
+                    " texts:",
+                    page_id,
+                    para_counter,
+                )
                 for line in para["l"]:
-                    line["text"] = extract_line_text(line)
-
-        num_regions = len(json_data["r"])
-        num_paragraphs = sum(
-            len(region["p"]) for region in json_data["r"] if "p" in region
-        )
-        num_lines = sum(
-            len(paragraph["l"])
-            for region in json_data["r"]
-            for paragraph in region["p"]
-        )
-        num_empty_lines = sum(
-            1
-            for region in json_data["r"]
-            for paragraph in region["p"]
-            for line in paragraph["l"]
-            if line == [] or len(line["text"]) == 0
-        )
-
-        avg_paragraphs_per_region = (
-            round(num_paragraphs / num_regions, 2) if num_regions > 0 else 0
-        )
-        avg_lines_per_region = (
-            round(num_lines / num_regions, 2) if num_regions > 0 else 0
-        )
-        avg_lines_per_paragraph = (
-            round(num_lines / num_paragraphs, 2) if num_paragraphs > 0 else 0
-        )
-
-        line_widths = [
-            line["c"][2]
-            for region in json_data["r"]
-            for paragraph in region["p"]
-            for line in paragraph["l"]
-            if "c" in line
-        ]
-        line_width_stats = compute_descriptive_statistics(line_widths)
-
-        line_heights = [
-            line["c"][3]
-            for region in json_data["r"]
-            for paragraph in region["p"]
-            for line in paragraph["l"]
-            if isinstance(line, dict)
-            and "c" in line
-            and len(line["c"]) >= 4
-            and line.get("t")
-        ]
-        line_height_stats = compute_descriptive_statistics(line_heights)
-
-        # Compute largest paragraph coordinates
-        max_area = 0
-        largest_coords = {}
-        for region in json_data["r"]:
-            for para in region["p"]:
-                coords_list = [
-                    line["c"]
-                    for line in para["l"]
-                    if "c" in line and len(line["c"]) >= 4
-                ]
-                if not coords_list:
-                    continue
-                min_x = min(c[0] for c in coords_list)
-                min_y = min(c[1] for c in coords_list)
-                max_x = max(c[0] + c[2] for c in coords_list)
-                max_y = max(c[1] + c[3] for c in coords_list)
-                area = (max_x - min_x) * (max_y - min_y)
-                if area > max_area:
-                    max_area = area
-                    largest_coords = {
+                    log.debug(extract_line_text(line))
+            paragraph_coverages.append(
+                {
+                    "coords": {
                         "x": min_x,
                         "y": min_y,
                         "width": max_x - min_x,
                         "height": max_y - min_y,
-                    }
-        log.info("Largest paragraph coordinates: %s", largest_coords)
-
-        # Compute paragraph coverage percentages
-        paragraph_coverages = []
-        para_coverage_counter = 0
-        for region in json_data["r"]:
-            for para in region["p"]:
-                para_coverage_counter += 1
-                coords_list = [
-                    line["c"]
-                    for line in para["l"]
-                    if "c" in line and len(line["c"]) >= 4
-                ]
-                if not coords_list:
-                    continue
-                min_x = min(c[0] for c in coords_list)
-                min_y = min(c[1] for c in coords_list)
-                max_x = max(c[0] + c[2] for c in coords_list)
-                max_y = max(c[1] + c[3] for c in coords_list)
-                total_line_area = sum(c[2] * c[3] for c in coords_list)
-                bounding_area = (max_x - min_x) * (max_y - min_y)
-                coverage = (
-                    round(total_line_area / bounding_area * 100, 2)
-                    if bounding_area > 0
-                    else 0
-                )
-                if coverage < 70:
-                    log.info(
-                        "Page %s: Paragraph %d coverage below 70%%: %s%% at x=%s,"
-                        " y=%s, width=%s, height=%s: %s",
-                        page_id,
-                        para_coverage_counter,
-                        coverage,
-                        min_x,
-                        min_y,
-                        max_x - min_x,
-                        max_y - min_y,
-                        para.get("l")[0].get("text", "No text available")[:20],
-                    )
-                if coverage < 70:
-                    line_texts = [line.get("text", "") for line in para["l"]]
-                    log.debug(
-                        "Page %s: Paragraph %d coverage below 70%%, emitting line"
-                        " texts:",
-                        page_id,
-                        para_coverage_counter,
-                    )
-                    for text in line_texts:
-                        log.debug(text)
-                paragraph_coverages.append(
-                    {
-                        "coords": {
-                            "x": min_x,
-                            "y": min_y,
-                            "width": max_x - min_x,
-                            "height": max_y - min_y,
-                        },
-                        "coverage_percent": coverage,
-                    }
-                )
+                    },
+                    "coverage_percent": coverage,
+                }
+            )
 
-        return {
-            "num_regions": num_regions,
-            "num_paragraphs": num_paragraphs,
-            "num_lines": num_lines,
-            "num_empty_lines": num_empty_lines,
-            "avg_paragraphs_per_region": avg_paragraphs_per_region,
-            "avg_lines_per_region": avg_lines_per_region,
-            "avg_lines_per_paragraph": avg_lines_per_paragraph,
-            "line_width_stats": line_width_stats,
-            "line_height_stats": line_height_stats,
-            "paragraph_coverages": paragraph_coverages,
-        }
+    log.info("Largest paragraph coordinates: %s", largest_coords)
+
+    avg_paragraphs_per_region = (
+        round(num_paragraphs / num_regions, 2) if num_regions > 0 else 0
+    )
+    avg_lines_per_region = round(num_lines / num_regions, 2) if num_regions > 0 else 0
+    avg_lines_per_paragraph = (
+        round(num_lines / num_paragraphs, 2) if num_paragraphs > 0 else 0
+    )
+
+    line_width_stats = compute_descriptive_statistics(line_widths)
+    line_height_stats = compute_descriptive_statistics(line_heights)
+
+    return {
+        "num_regions": num_regions,
+        "num_paragraphs": num_paragraphs,
+        "num_lines": num_lines,
+        "num_empty_lines": num_empty_lines,
+        "avg_paragraphs_per_region": avg_paragraphs_per_region,
+        "avg_lines_per_region": avg_lines_per_region,
+        "avg_lines_per_paragraph": avg_lines_per_paragraph,
+        "line_width_stats": line_width_stats,
+        "line_height_stats": line_height_stats,
+        "paragraph_coverages": paragraph_coverages,
+    }
 
 
 def extract_line_text(line: Dict[str, Any]) -> str:
@@ -338,9 +328,9 @@ def extract_line_text(line: Dict[str, Any]) -> str:
     Returns:
         str: The concatenated text of the line.
     """
-    if isinstance(line, dict) and "t" in line:
+    if "t" in line:
         return " ".join(
-            segment["tx"] for segment in line["t"] if segment.get("tx")
+            [segment["tx"] for segment in line["t"] if segment.get("tx")]
         ).strip()
     return ""
 
@@ -370,21 +360,26 @@ def compute_descriptive_statistics(values: list) -> Dict[str, Any]:
             "kurtosis": 0,
         }
 
-    count = len(values)
-    mean = round(np.mean(values), 2)
-    median = round(np.median(values), 2)
-    mode = max(set(values), key=values.count) if values else None
-    min_value = min(values)
-    max_value = max(values)
+    values_array = np.asarray(values)
+    count = values_array.size
+    raw_mean = values_array.mean()
+    mean = round(raw_mean, 2)
+    median = round(np.median(values_array), 2)
+    unique_values, counts = np.unique(values_array, return_counts=True)
+    mode = unique_values[counts.argmax()].item()
+    min_value = values_array.min().item()
+    max_value = values_array.max().item()
     value_range = max_value - min_value
-    variance = round(np.var(values, ddof=1), 2)
-    std_dev = round(np.std(values, ddof=1), 2)
-    skewness = round((3 * (mean - median)) / std_dev, 2) if std_dev != 0 else 0
 
-    # Fix numpy array operation
-    values_array = np.array(values)
+    # Second and fourth central moments share the squared deviations
+    squared_deviations = (values_array - raw_mean) ** 2
+    raw_variance = squared_deviations.sum() / (count - 1) if count > 1 else np.nan
+    variance = round(raw_variance, 2)
+    std_dev = round(np.sqrt(raw_variance), 2)
+
+    skewness = round((3 * (mean - median)) / std_dev, 2) if std_dev != 0 else 0
     kurtosis = (
-        round(np.mean((values_array - mean) ** 4) / (std_dev**4) - 3, 2)
+        round(np.mean(squared_deviations * squared_deviations) / (std_dev**4) - 3, 2)
         if std_dev != 0
         else 0
     )